@@ -44,7 +44,7 @@ class ABIFunction:
     def argument_count(self) -> int:
         return len(self.argument_types)
 
-    @property
+    @cached_property
     def signature(self) -> str:
         return f"({_format_abi_type(self.argument_types)})"
 
@@ -237,6 +237,7 @@ class ABIContract(_BaseEVMContract):
         filename: Optional[str] = None,
         env=None,
     ):
+        address = Address(address)
         super().__init__(env, filename=filename, address=address)
         self._name = name
         self._abi = abi
@@ -257,7 +258,6 @@ class ABIContract(_BaseEVMContract):
             if fn_name is not None:  # constructors have no name
                 setattr(self, fn_name, ABIOverload.create(group, self))
 
-        self._address = Address(address)
         self._computation: Optional[ComputationAPI] = None
 
     @property
@@ -302,8 +302,8 @@ class ABIContract(_BaseEVMContract):
             reason = " ".join(str(arg) for arg in computation.error.args if arg != b"")
 
         calldata_method_id = bytes(computation.msg.data[:4])
-        if calldata_method_id in self.method_id_map:
-            function = self.method_id_map[calldata_method_id]
+        function = self.method_id_map.get(calldata_method_id)
+        if function is not None:
             msg = f"  {reason}({self}.{function.pretty_signature})"
         else:
             # Method might not be specified in the ABI
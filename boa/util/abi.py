@@ -66,7 +66,9 @@ class _ABIDecoder(Decoder):
     def visit_AddressNode(
         cls, node: nodes.AddressNode, value: bytes, checksum: bool = True, **kwargs: Any
     ) -> "Address":
-        ret = super().visit_AddressNode(node, value)
+        # skip the checksum in the base decoder, `Address` computes (and
+        # caches) it anyway.
+        ret = super().visit_AddressNode(node, value, checksum=False)
         return Address(ret)
 
 